@@ -1,16 +1,73 @@
+import abc
+import collections
+import concurrent.futures
+import copy
 import dataclasses
+import functools
+import inspect
+import itertools
+import operator
+import sys
+import types
+import typing
 
-from django.db import models
+from django.db import models, router
+from django.db.models.query_utils import DeferredAttribute
 
 from django_dto import exceptions
 
 
+@functools.lru_cache(maxsize=None)
+def _get_model_fields(django_model_cls: type[models.Model]) -> tuple[models.Field, ...]:
+    return tuple(django_model_cls._meta.get_fields())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_dataclass_fields(dataclass_cls: type) -> tuple[dataclasses.Field, ...]:
+    return dataclasses.fields(dataclass_cls)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_type_hints(dataclass_cls: type) -> dict[str, any]:
+    """
+    Returns the resolved annotations of `dataclass_cls`, resolving string annotations
+    (i.e. `from __future__ import annotations`). Annotations that can't be resolved
+    are left out, and the raw annotation is used instead.
+    """
+    try:
+        return typing.get_type_hints(dataclass_cls)
+    except (NameError, TypeError):
+        # Some annotation refers to names not reachable from the module (e.g. a
+        # class defined in a function), or can't be evaluated on this Python
+        # version (e.g. `int | None` before 3.10): resolve the others one by one
+        pass
+
+    type_hints = {}
+    for base in reversed(dataclass_cls.__mro__):
+        module = sys.modules.get(base.__module__)
+        global_namespace = getattr(module, "__dict__", {})
+        local_namespace = dict(vars(base))
+        for name, annotation in base.__dict__.get("__annotations__", {}).items():
+            if not isinstance(annotation, str):
+                type_hints[name] = annotation
+                continue
+            try:
+                type_hints[name] = eval(annotation, global_namespace, local_namespace)
+            except Exception:
+                # Evaluating an annotation may fail in any way: keep it raw
+                type_hints.pop(name, None)
+    return type_hints
+
+
 class DjangoField:
+    __slots__ = ("_field", "_is_foreign_key")
+
     def __init__(self, field: models.Field):
         self._field = field
+        self._is_foreign_key = bool(field.related_model)
 
     def is_foreign_key(self) -> bool:
-        return bool(self._field.related_model)
+        return self._is_foreign_key
 
     def is_m2m(self) -> bool:
         return isinstance(self._field, models.ManyToManyField)
@@ -22,12 +79,23 @@ class DjangoField:
     @property
     def type(self) -> type:
         # We don't provide a type for django fields, but we need it for foreign keys
-        if self.is_foreign_key():
+        if self._is_foreign_key:
             return self._field.related_model
         return None
 
 
 class DjangoModelAnalyzer:
+    __slots__ = (
+        "_django_model_cls",
+        "_raw_fields",
+        "_names",
+        "_field_names",
+        "_related_models",
+        "_related_models_by_name",
+    )
+
+    _cache: dict[type, "DjangoModelAnalyzer"] = {}
+
     def __init__(self, django_model_cls):
         if not issubclass(django_model_cls, models.Model):
             raise exceptions.NotADjangoModel(
@@ -35,35 +103,95 @@ class DjangoModelAnalyzer:
             )
 
         self._django_model_cls: type[models.Model] = django_model_cls
-        self._fields: list[DjangoField] = {
-            DjangoField(field).name: DjangoField(field)
-            for field in self._django_model_cls._meta.get_fields()
-            if not DjangoField(field).is_m2m()
+        raw_fields = [
+            field
+            for field in _get_model_fields(self._django_model_cls)
+            if not isinstance(field, models.ManyToManyField)
+        ]
+        # Field metadata is stored as flat, parallel structures rather than as
+        # DjangoField wrappers, which are only built on demand. Names are
+        # interned so that lookups keyed on them compare by identity
+        self._raw_fields: dict[str, models.Field] = {
+            sys.intern(field.name): field for field in raw_fields
         }
+        self._names: tuple[str, ...] = tuple(self._raw_fields)
+        self._field_names: frozenset[str] = frozenset(self._names)
+        self._related_models: tuple[typing.Optional[type], ...] = tuple(
+            field.related_model for field in raw_fields
+        )
+        self._related_models_by_name: dict[str, typing.Optional[type]] = dict(
+            zip(self._names, self._related_models)
+        )
+
+    @classmethod
+    def for_model(cls, django_model_cls) -> "DjangoModelAnalyzer":
+        """
+        Returns the analyzer of `django_model_cls`, introspecting the model only once.
+        """
+        if django_model_cls not in cls._cache:
+            cls._cache[django_model_cls] = cls(django_model_cls)
+        return cls._cache[django_model_cls]
 
     def get_fields(self) -> list[DjangoField]:
-        return self._fields.values()
+        return [DjangoField(field) for field in self._raw_fields.values()]
 
     def get_field(self, field_name: str) -> DjangoField:
-        if field_name not in self._fields:
+        if field_name not in self._raw_fields:
             raise AttributeError(
                 f"Field `{field_name}` not found in Django model {self._django_model_cls.__name__}"
             )
-        return self._fields[field_name]
+        return DjangoField(self._raw_fields[field_name])
 
     def get_field_type(self, field_name: str) -> type:
-        return self.get_field(field_name).type
+        if field_name not in self._related_models_by_name:
+            raise AttributeError(
+                f"Field `{field_name}` not found in Django model {self._django_model_cls.__name__}"
+            )
+        return self._related_models_by_name[field_name]
+
+    def get_field_names(self) -> tuple[str, ...]:
+        return self._names
+
+    def is_single_valued_relation(self, field_name: str) -> bool:
+        """
+        Returns True if `field_name` is a foreign key or a one to one relation, either
+        declared on the model or reversed (i.e. it can be used with `select_related`).
+        """
+        field = self._raw_fields[field_name]
+        return field.one_to_one or (field.concrete and field.many_to_one)
+
+    def is_plain_column(self, field_name: str) -> bool:
+        """
+        Returns True if the value read from the model instance attribute is the value
+        returned by `values_list` (e.g. False for file fields).
+        """
+        field = self._raw_fields[field_name]
+        return field.concrete and field.descriptor_class is DeferredAttribute
 
-    def get_field_names(self) -> list[str]:
-        return self._fields.keys()
+    def get_fields_with_related_models(
+        self,
+    ) -> typing.Iterator[tuple[str, typing.Optional[type]]]:
+        return zip(self._names, self._related_models)
 
     def is_field_available(self, field_name: str) -> bool:
-        return field_name in self._fields
+        return field_name in self._field_names
+
+    def __contains__(self, field_name: str) -> bool:
+        return field_name in self._field_names
 
 
 class DataclassField:
-    def __init__(self, field: dataclasses.Field):
+    __slots__ = ("_field", "_type", "_is_dataclass", "_has_default")
+
+    def __init__(self, field: dataclasses.Field, field_type: type = None):
         self._field = field
+        # Resolved type hint, falls back to the raw (possibly string) annotation
+        self._type = field.type if field_type is None else field_type
+        self._is_dataclass = dataclasses.is_dataclass(self._type)
+        self._has_default = (
+            field.default is not dataclasses.MISSING
+            or field.default_factory is not dataclasses.MISSING
+        )
 
     @property
     def name(self) -> str:
@@ -71,13 +199,43 @@ class DataclassField:
 
     @property
     def type(self) -> type:
-        return self._field.type
+        return self._type
+
+    @property
+    def init(self) -> bool:
+        return self._field.init
+
+    @property
+    def kw_only(self) -> bool:
+        # `kw_only` is only available from Python 3.10
+        return getattr(self._field, "kw_only", False) is True
+
+    @property
+    def has_default(self) -> bool:
+        return self._has_default
+
+    @property
+    def default(self) -> any:
+        return self._field.default
+
+    @property
+    def default_factory(self) -> any:
+        return self._field.default_factory
 
     def is_dataclass(self) -> bool:
-        return dataclasses.is_dataclass(self.type)
+        return self._is_dataclass
 
 
 class DataclassAnalyser:
+    __slots__ = (
+        "_dataclass_cls",
+        "_dataclass_fields",
+        "_field_names",
+        "_required_field_names",
+    )
+
+    _cache: dict[type, "DataclassAnalyser"] = {}
+
     def __init__(self, dataclass_cls: type):
         if not dataclasses.is_dataclass(dataclass_cls):
             raise exceptions.NotADataclass(
@@ -85,223 +243,910 @@ class DataclassAnalyser:
             )
 
         self._dataclass_cls = dataclass_cls
-        self._dataclass_fields = {
-            field.name: DataclassField(field)
-            for field in dataclasses.fields(dataclass_cls)
+        type_hints = _get_type_hints(dataclass_cls)
+        self._dataclass_fields: dict[str, DataclassField] = {
+            sys.intern(field.name): DataclassField(field, type_hints.get(field.name))
+            for field in _get_dataclass_fields(dataclass_cls)
         }
+        self._field_names: frozenset[str] = frozenset(self._dataclass_fields)
+        self._required_field_names: frozenset[str] = frozenset(
+            field.name
+            for field in self._dataclass_fields.values()
+            if field.init and not field.has_default
+        )
 
-    def get_field_names(self) -> list[str]:
+    @classmethod
+    def for_dataclass(cls, dataclass_cls: type) -> "DataclassAnalyser":
+        """
+        Returns the analyser of `dataclass_cls`, introspecting the dataclass only once.
+        """
+        if dataclass_cls not in cls._cache:
+            cls._cache[dataclass_cls] = cls(dataclass_cls)
+        return cls._cache[dataclass_cls]
+
+    def get_fields(self) -> typing.ValuesView[DataclassField]:
+        return self._dataclass_fields.values()
+
+    def get_field_names(self) -> typing.KeysView[str]:
         return self._dataclass_fields.keys()
 
     def is_field_available(self, field_name: str) -> bool:
-        return field_name in self._dataclass_fields()
+        return field_name in self._field_names
+
+    def __contains__(self, field_name: str) -> bool:
+        return field_name in self._field_names
 
     def get_field_type(self, field_name: str) -> any:
         return self._dataclass_fields[field_name].type
 
+    def get_required_field_names(self) -> frozenset[str]:
+        """
+        Returns the names of the fields the dataclass can't be built without.
+        """
+        return self._required_field_names
+
     def get_field(self, field_name: str) -> DataclassField:
         return self._dataclass_fields[field_name]
 
+    def has_post_init(self) -> bool:
+        return hasattr(self._dataclass_cls, "__post_init__")
 
-class DjangoModelInstance:
-    def __init__(self, django_model_instance: models.Model):
-        self._django_model_instance = django_model_instance
-        self._django_model_analyser = DjangoModelAnalyzer(type(django_model_instance))
 
-    def get_value(self, field_name: str) -> any:
-        if not self._django_model_analyser.is_field_available(field_name):
-            raise exceptions.DjangoFieldNotFound(
-                f"Field `{field_name}` not found in Django instance"
-            )
-        return getattr(self._django_model_instance, field_name)
+def _matches_type(value: any, expected_type: type) -> bool:
+    try:
+        return isinstance(value, expected_type)
+    except TypeError:
+        # `expected_type` can't be used with isinstance (e.g. `list[int]`)
+        return False
 
-    def get_class_name(self) -> str:
-        return self._django_model_instance.__class__.__name__
 
+# `X | None` annotations (Python 3.10+) are not `typing.Union` instances
+_UNION_TYPES = (typing.Union, getattr(types, "UnionType", typing.Union))
 
-class DataclassInstance:
-    def __init__(self, dataclass_instance: any):
-        self._dataclass_instance = dataclass_instance
 
-    def get_value(self, field_name: str) -> any:
-        return getattr(self._dataclass_instance, field_name)
+def _validation_type(annotation: any) -> tuple[any, bool]:
+    """
+    Returns the type (or tuple of types) values annotated with `annotation` are
+    checked against, None if any value is valid (e.g. `Any`), and whether None is a
+    valid value (e.g. `Optional[...]`).
+    """
+    if annotation is typing.Any or annotation is object:
+        return None, True
+    if typing.get_origin(annotation) not in _UNION_TYPES:
+        return annotation, False
 
+    arguments = typing.get_args(annotation)
+    types_arguments = tuple(
+        argument for argument in arguments if argument is not type(None)
+    )
+    if any(argument is typing.Any or argument is object for argument in arguments):
+        return None, True
+    # Unions can't be used with isinstance before Python 3.10, tuples can
+    if len(types_arguments) == 1:
+        return types_arguments[0], len(types_arguments) < len(arguments)
+    return types_arguments, len(types_arguments) < len(arguments)
 
-class DjangoInstanceToDataclassTranslator:
-    def __init__(
-        self, django_model_instance: models.Model, dataclass_cls: any, fields_map: dict
-    ):
-        self._django_model_instance = DjangoModelInstance(django_model_instance)
-        self._dataclass_cls = dataclass_cls
-        self._django_model_analyser = DjangoModelAnalyzer(type(django_model_instance))
-        self._dataclass_analyser = DataclassAnalyser(dataclass_cls)
-        self._fields_map = fields_map or {}
-
-    def _get_corresponding_dataclass_field_name(self, django_field_name: str) -> str:
-        if django_field_name in self._fields_map:
-            if isinstance(self._fields_map[django_field_name], dict):
-                field_name = self._fields_map[django_field_name].get("field_name")
-                if not field_name:
-                    raise exceptions.FieldsMapKeyError(
-                        f"Can't find `field_name` key in the `fields_map` value for `{django_field_name}`"
-                    )
-            else:
-                field_name = self._fields_map.get(django_field_name)
-                if not field_name:
-                    raise exceptions.FieldsMapKeyError(
-                        f"Can't find `{django_field_name}` key in the `fields_map`."
-                    )
+
+def _values_getter(field_names: list[str]) -> typing.Callable[[any], tuple]:
+    """
+    Returns a callable extracting `field_names` from an object as a tuple of values.
+    """
+    if not field_names:
+        return lambda obj: ()
+    if len(field_names) == 1:
+        # attrgetter returns a bare value, not a tuple, for a single attribute
+        getter = operator.attrgetter(field_names[0])
+        return lambda obj: (getter(obj),)
+    return operator.attrgetter(*field_names)
+
+
+_EMPTY_FROZEN_FIELDS_MAP = ()
+
+
+def _freeze_fields_map(fields_map: typing.Optional[dict]) -> tuple:
+    """
+    Returns a hashable equivalent of `fields_map`, used to key the translators cache.
+
+    Items are kept in order: building a tuple is cheaper than a frozenset, and maps
+    only differing by their order just get translators of their own.
+    """
+    if not fields_map:
+        # Most translations don't remap fields: skip building a new tuple
+        return _EMPTY_FROZEN_FIELDS_MAP
+    return tuple(
+        [
+            (key, _freeze_fields_map(value) if isinstance(value, dict) else value)
+            for key, value in fields_map.items()
+        ]
+    )
+
+
+def _normalize_fields_map(
+    fields_map: typing.Optional[dict], exception_cls: type[Exception]
+) -> typing.Mapping[str, tuple[str, typing.Optional[dict]]]:
+    """
+    Normalizes both shapes of `fields_map` values (a field name, or a dict with
+    `field_name` and an optional `submapping`) to `(field_name, submapping)` tuples,
+    in a read-only mapping.
+
+    Raises `exception_cls` if a value doesn't provide a field name.
+    """
+    normalized_fields_map = {}
+    for field_name, fields_map_value in (fields_map or {}).items():
+        if isinstance(fields_map_value, dict):
+            mapped_field_name = fields_map_value.get("field_name")
+            if not mapped_field_name:
+                raise exception_cls(
+                    f"Can't find `field_name` key in the `fields_map` value for `{field_name}`"
+                )
+            submapping = fields_map_value.get("submapping")
+        else:
+            mapped_field_name = fields_map_value
+            if not mapped_field_name:
+                raise exception_cls(
+                    f"Can't find `{field_name}` key in the `fields_map`."
+                )
+            submapping = None
+        normalized_fields_map[sys.intern(field_name)] = (
+            sys.intern(mapped_field_name),
+            submapping,
+        )
+    return types.MappingProxyType(normalized_fields_map)
+
+
+def _validation_failed(
+    value: any, field_path: str, expected_type: type
+) -> exceptions.ValidationFailed:
+    return exceptions.ValidationFailed(
+        f"`{value}` from `{field_path}` does not match type `{expected_type}`"
+    )
+
+
+def _cant_build_dataclass(
+    missing_field_names: typing.Iterable[str] = (),
+) -> exceptions.CantBuildDataclass:
+    if missing_field_names:
+        return exceptions.CantBuildDataclass(
+            "Some mandatory arguments are missing and dataclass can't be built: "
+            f"{', '.join(f'`{name}`' for name in missing_field_names)}. "
+            "Set `nullify_missing_fields` to True to fill missing fields with None."
+        )
+    return exceptions.CantBuildDataclass(
+        f"Some mandatory arguments are missing and dataclass can't be built. "
+        "See full stacktrace for more details or set `nullify_missing_fields` "
+        "to True to fill missing fields with None."
+    )
+
+
+def _dataclass_arguments(
+    dataclass_analyser: "DataclassAnalyser", values: dict[str, str]
+) -> str:
+    """
+    Returns the source of the arguments building a dataclass from `values`, a map of
+    field names to source expressions.
+
+    Arguments are positional, in declaration order, until a field is left to its
+    default value, keyword arguments from then on. Keyword-only fields, which
+    `__init__` takes after all the others whatever their declaration order, are
+    passed last.
+    """
+    arguments = []
+    keyword_only_arguments = []
+    positional = True
+    for field in dataclass_analyser.get_fields():
+        if not field.init:
+            continue
+        if field.kw_only:
+            if field.name in values:
+                keyword_only_arguments.append(f"{field.name}={values[field.name]}")
+        elif field.name not in values:
+            positional = False
+        elif positional:
+            arguments.append(values[field.name])
         else:
-            field_name = django_field_name
+            arguments.append(f"{field.name}={values[field.name]}")
+    return ", ".join(arguments + keyword_only_arguments)
+
 
-        return field_name
+def _dataclass_fast_construction(
+    dataclass_cls: type,
+    dataclass_analyser: "DataclassAnalyser",
+    values: dict[str, str],
+    namespace: dict,
+    prefix: str = "",
+) -> list[str]:
+    """
+    Returns the source lines building, in `{prefix}_obj`, a dataclass from `values`,
+    a map of field names to source expressions, without calling its `__init__`: the
+    instance is allocated with `__new__` and its fields are set directly. Fields left
+    out of `values` are set to their default value, which is added to `namespace`.
+    """
+    namespace[f"{prefix}_new"] = dataclass_cls.__new__
+    namespace["_object_setattr"] = object.__setattr__
+    assignments = {}
+    for field in dataclass_analyser.get_fields():
+        if field.name in values:
+            assignments[field.name] = values[field.name]
+        elif field.default is not dataclasses.MISSING:
+            namespace[f"{prefix}_default_{field.name}"] = field.default
+            assignments[field.name] = f"{prefix}_default_{field.name}"
+        elif field.default_factory is not dataclasses.MISSING:
+            namespace[f"{prefix}_factory_{field.name}"] = field.default_factory
+            assignments[field.name] = f"{prefix}_factory_{field.name}()"
 
-    def _get_corresponding_dataclass_field_submapping(
-        self, django_field_name: str
-    ) -> dict:
-        if django_field_name in self._fields_map and isinstance(
-            self._fields_map[django_field_name], dict
+    lines = [f"{prefix}_obj = {prefix}_new({prefix}_dataclass_cls)"]
+    dict_assigned = False
+    for name, value in assignments.items():
+        if isinstance(
+            inspect.getattr_static(dataclass_cls, name, None),
+            types.MemberDescriptorType,
         ):
-            return self._fields_map[django_field_name].get("submapping", {})
-        return {}
+            # Slots shadow the instance `__dict__` (if any, e.g. in hierarchies mixing
+            # slotted and plain classes): they must be set through their descriptor
+            lines.append(f"_object_setattr({prefix}_obj, {name!r}, {value})")
+            continue
+        if not dict_assigned:
+            lines.append(f"{prefix}_obj_dict = {prefix}_obj.__dict__")
+            dict_assigned = True
+        # Item assignments bypass `__setattr__`, so frozen dataclasses can be filled,
+        # and are cheaper than building keyword arguments for `__dict__.update`
+        lines.append(f"{prefix}_obj_dict[{name!r}] = {value}")
+    return lines
+
+
+def _create_function(
+    name: str, args: str, body: list[str], namespace: dict
+) -> typing.Callable:
+    """
+    Compiles a function from the source lines in `body`, much like the standard
+    library does to generate dataclasses' `__init__`.
+
+    `namespace` holds every object the body refers to.
+    """
+    source = f"def {name}({args}):\n" + "\n".join(f"    {line}" for line in body)
+    local_namespace = {}
+    exec(source, namespace, local_namespace)
+    return local_namespace[name]
+
+
+class CompiledTranslator(abc.ABC):
+    """
+    Base class of translators generating, on first use, a function specialized to
+    translate their instances.
+    """
+
+    __slots__ = ("_translate",)
 
-    def _get_mappable_django_field_names(self) -> list[DjangoField]:
+    def __init__(self):
+        # Compiled lazily, so that translators of self-referencing relations can
+        # be registered in the cache before their sub-translators are resolved
+        self._translate = None
+
+    @abc.abstractmethod
+    def _compile(
+        self,
+    ) -> tuple[typing.Callable, dict, dict[str, "CompiledTranslator"]]:
         """
-        Returns a list of Django fields that can be mapped to the dataclass.
+        Returns the generated function, its namespace and the sub-translators whose
+        functions the generated code calls, by namespace name.
         """
-        dataclass_field_names = self._dataclass_analyser.get_field_names()
-        return [
-            self._django_model_analyser.get_field(django_field_name)
-            for django_field_name in self._django_model_analyser.get_field_names()
-            if self._get_corresponding_dataclass_field_name(django_field_name)
-            in dataclass_field_names
-        ]
 
-    def translate(
-        self, validate_types: bool, recurse: bool, nullify_missing_fields: bool
+    def _compile_all(self):
+        """
+        Compiles this translator and every sub-translator reachable from it, walking
+        relations with an explicit stack rather than recursively, then links the
+        generated functions so that nested translations call each other directly.
+        """
+        compiled = {}
+        pending = collections.deque([self])
+        while pending:
+            translator = pending.pop()
+            if translator._translate is not None or translator in compiled:
+                continue
+            compiled[translator] = translator._compile()
+            pending.extend(compiled[translator][2].values())
+
+        # Translators are only marked as compiled once the whole tree built fine
+        for translator, (function, namespace, sub_translators) in compiled.items():
+            for name, sub_translator in sub_translators.items():
+                namespace[name] = (
+                    sub_translator._translate or compiled[sub_translator][0]
+                )
+        for translator, (function, _, _) in compiled.items():
+            translator._translate = function
+
+    def translate(self, instance: any) -> any:
+        if self._translate is None:
+            self._compile_all()
+        return self._translate(instance)
+
+
+class DjangoInstanceToDataclassTranslator(CompiledTranslator):
+    """
+    Translates instances of a Django model to a dataclass.
+
+    Translators are built once per (model, dataclass, fields map, options) through
+    `for_classes`, and compile on first use a function specialized for them.
+    """
+
+    __slots__ = (
+        "_django_model_cls",
+        "_dataclass_cls",
+        "_django_model_analyser",
+        "_dataclass_analyser",
+        "_fields_map",
+        "_validate_types",
+        "_recurse",
+        "_nullify_missing_fields",
+        "_plan",
+        "_values_plan",
+        "_relations_plan",
+        "_get_values",
+        "_translate_values",
+        "_signature",
+        "_fast",
+    )
+
+    _cache: dict[tuple, "DjangoInstanceToDataclassTranslator"] = {}
+
+    def __init__(
+        self,
+        django_model_cls: type[models.Model],
+        dataclass_cls: any,
+        fields_map: dict,
+        validate_types: bool,
+        recurse: bool,
+        nullify_missing_fields: bool,
+        fast: bool = False,
     ):
-        dataclass_kwargs = {}
-        for field in self._get_mappable_django_field_names():
-            dataclass_field_name = self._get_corresponding_dataclass_field_name(
-                field.name
+        super().__init__()
+        # Arguments of `for_classes`, to rebuild the translator in other processes.
+        # `fields_map` is copied, as it keys the cache as it is now
+        self._signature = (
+            django_model_cls,
+            dataclass_cls,
+            copy.deepcopy(fields_map),
+            validate_types,
+            recurse,
+            nullify_missing_fields,
+            fast,
+        )
+        self._django_model_cls = django_model_cls
+        self._dataclass_cls = dataclass_cls
+        self._django_model_analyser = DjangoModelAnalyzer.for_model(django_model_cls)
+        self._dataclass_analyser = DataclassAnalyser.for_dataclass(dataclass_cls)
+        self._fields_map = _normalize_fields_map(
+            fields_map, exceptions.FieldsMapKeyError
+        )
+        self._validate_types = validate_types
+        self._recurse = recurse
+        self._nullify_missing_fields = nullify_missing_fields
+        self._fast = fast
+        self._plan = self._build_plan()
+        # Plain values are read in the dataclass fields order, so that they can be
+        # passed as they are to the dataclass when no processing is needed
+        dataclass_field_names = list(self._dataclass_analyser.get_field_names())
+        self._values_plan = sorted(
+            (entry for entry in self._plan if entry[1] is None),
+            key=lambda entry: dataclass_field_names.index(entry[2]),
+        )
+        self._relations_plan = [entry for entry in self._plan if entry[1] is not None]
+        self._get_values = _values_getter([entry[0] for entry in self._values_plan])
+        self._translate_values = None
+
+    @classmethod
+    def for_classes(
+        cls,
+        django_model_cls: type[models.Model],
+        dataclass_cls: any,
+        fields_map: dict,
+        validate_types: bool,
+        recurse: bool,
+        nullify_missing_fields: bool,
+        fast: bool = False,
+    ) -> "DjangoInstanceToDataclassTranslator":
+        """
+        Returns the translator for the given classes and options, building it only once.
+        """
+        key = (
+            django_model_cls,
+            dataclass_cls,
+            _freeze_fields_map(fields_map),
+            validate_types,
+            recurse,
+            nullify_missing_fields,
+            fast,
+        )
+        if key not in cls._cache:
+            cls._cache[key] = cls(
+                django_model_cls,
+                dataclass_cls,
+                fields_map,
+                validate_types,
+                recurse,
+                nullify_missing_fields,
+                fast,
             )
-            if field.is_foreign_key():
-                if recurse:
-                    dataclass_field_value = DjangoInstanceToDataclassTranslator(
-                        self._django_model_instance.get_value(field.name),
-                        self._dataclass_analyser.get_field_type(dataclass_field_name),
-                        self._get_corresponding_dataclass_field_submapping(field.name),
-                    ).translate(validate_types, recurse, nullify_missing_fields)
-                else:
-                    dataclass_field_value = None
-            else:
+        return cls._cache[key]
+
+    def _build_plan(
+        self,
+    ) -> list[tuple[str, typing.Optional[type], str, type, typing.Optional[dict]]]:
+        """
+        Resolves, once, the Django fields that can be mapped to the dataclass (i.e. to
+        its fields accepted by `__init__`).
+
+        Returns a list of `(django_field_name, related_model, dataclass_field_name,
+        dataclass_field_type, submapping)` tuples, where `related_model` is None for
+        non relational fields.
+        """
+        plan = []
+        for (
+            django_field_name,
+            related_model,
+        ) in self._django_model_analyser.get_fields_with_related_models():
+            dataclass_field_name, submapping = self._fields_map.get(
+                django_field_name, (django_field_name, None)
+            )
+
+            if (
+                dataclass_field_name in self._dataclass_analyser
+                # Fields excluded from `__init__` are left to the dataclass
+                and self._dataclass_analyser.get_field(dataclass_field_name).init
+            ):
                 dataclass_field_type = self._dataclass_analyser.get_field_type(
                     dataclass_field_name
                 )
-                dataclass_field_value = self._django_model_instance.get_value(
-                    field.name
+                plan.append(
+                    (
+                        django_field_name,
+                        related_model,
+                        dataclass_field_name,
+                        dataclass_field_type,
+                        submapping,
+                    )
+                )
+        return plan
+
+    def _get_sub_translator(
+        self, related_model: type, dataclass_field_type: type, submapping: dict
+    ) -> "DjangoInstanceToDataclassTranslator":
+        return DjangoInstanceToDataclassTranslator.for_classes(
+            related_model,
+            dataclass_field_type,
+            submapping,
+            self._validate_types,
+            self._recurse,
+            self._nullify_missing_fields,
+            self._fast,
+        )
+
+    def _compile(
+        self,
+    ) -> tuple[typing.Callable, dict, dict[str, CompiledTranslator]]:
+        return self._generate("instance", "_get_values(instance)")
+
+    def _generate(
+        self, argument: str, values_source: str
+    ) -> tuple[typing.Callable, dict, dict[str, CompiledTranslator]]:
+        """
+        Generates a straight-line translation function: values are read, validated
+        (only if `validate_types`) and passed to the dataclass, with no lookups in
+        the plan or branching on options at translation time. If `fast`, the
+        dataclass is filled directly instead of going through its `__init__`.
+
+        The function takes `argument`, from which `values_source` builds the tuple of
+        the plain (non relational) values. Relations are read from `instance`.
+        """
+        namespace = {
+            "_matches_type": _matches_type,
+            "_validation_failed": _validation_failed,
+            "_cant_build_dataclass": _cant_build_dataclass,
+        }
+        sub_translators = {}
+        body, result = self._generate_body(
+            "instance", values_source, "", (self,), namespace, sub_translators
+        )
+        if result is not None:
+            body.append(f"return {result}")
+        return (
+            _create_function("translate", argument, body, namespace),
+            namespace,
+            sub_translators,
+        )
+
+    def _generate_body(
+        self,
+        instance: str,
+        values_source: str,
+        prefix: str,
+        path: tuple["DjangoInstanceToDataclassTranslator", ...],
+        namespace: dict,
+        sub_translators: dict[str, CompiledTranslator],
+    ) -> tuple[list[str], typing.Optional[str]]:
+        """
+        Returns the source lines translating the model instance held in `instance`,
+        and the expression of the resulting dataclass (None if the lines always
+        raise). Names added to `namespace` and locals are prefixed by `prefix`.
+
+        Translated relations are inlined, so that nested translations don't cost a
+        function call each. Only relations looping back to a translator of `path`
+        (e.g. self-referencing foreign keys) call that translator's function.
+        """
+        namespace[f"{prefix}_dataclass_cls"] = self._dataclass_cls
+        namespace[f"{prefix}_get_values"] = self._get_values
+        body = []
+        # Only fields without a default need to be nullified: the others are left
+        # out of the generated call (or filled with their default if `fast`)
+        dataclass_values = (
+            dict.fromkeys(self._dataclass_analyser.get_required_field_names(), "None")
+            if self._nullify_missing_fields
+            else {}
+        )
+
+        values = [f"{prefix}_value_{index}" for index in range(len(self._values_plan))]
+        if values:
+            body.append(f"{', '.join(values)}, = {values_source}")
+        for index, (_, _, dataclass_field_name, dataclass_field_type, _) in enumerate(
+            self._values_plan
+        ):
+            value = f"{prefix}_value_{index}"
+            validation_type, accepts_none = _validation_type(dataclass_field_type)
+            if self._validate_types and validation_type is not None:
+                expected_type = f"{prefix}_type_{index}"
+                namespace[expected_type] = dataclass_field_type
+                checked_type = expected_type
+                if validation_type is not dataclass_field_type:
+                    checked_type = f"{prefix}_checked_type_{index}"
+                    namespace[checked_type] = validation_type
+                field_path = f"{self._django_model_cls.__name__}.{dataclass_field_name}"
+                condition = f"not _matches_type({value}, {checked_type})"
+                if isinstance(validation_type, type):
+                    # Values are most often of the exact annotated class: check
+                    # identity first, isinstance only handles subclasses
+                    condition = f"type({value}) is not {checked_type} and {condition}"
+                if accepts_none:
+                    condition = f"{value} is not None and {condition}"
+                body += [
+                    f"if {condition}:",
+                    f"    raise _validation_failed({value}, {field_path!r}, {expected_type})",
+                ]
+            dataclass_values[dataclass_field_name] = value
+
+        for index, (
+            django_field_name,
+            related_model,
+            dataclass_field_name,
+            dataclass_field_type,
+            submapping,
+        ) in enumerate(self._relations_plan):
+            if not self._recurse:
+                dataclass_values[dataclass_field_name] = "None"
+                continue
+
+            related = f"{prefix}_related_{index}"
+            sub_translator = self._get_sub_translator(
+                related_model, dataclass_field_type, submapping
+            )
+            body += [
+                f"{related} = {instance}.{django_field_name}",
+                f"if {related} is not None:",
+            ]
+            if sub_translator in path:
+                sub_translators[f"{prefix}_translate_{index}"] = sub_translator
+                body.append(f"    {related} = {prefix}_translate_{index}({related})")
+            else:
+                sub_body, sub_result = sub_translator._generate_body(
+                    related,
+                    f"{related}_get_values({related})",
+                    related,
+                    path + (sub_translator,),
+                    namespace,
+                    sub_translators,
                 )
-                if (
-                    validate_types
-                    and type(dataclass_field_value) != dataclass_field_type
+                if sub_result is not None:
+                    sub_body.append(f"{related} = {sub_result}")
+                body += [f"    {line}" for line in sub_body]
+            dataclass_values[dataclass_field_name] = related
+
+        missing_field_names = sorted(
+            self._dataclass_analyser.get_required_field_names()
+            - dataclass_values.keys()
+        )
+        arguments = _dataclass_arguments(self._dataclass_analyser, dataclass_values)
+        if missing_field_names:
+            # Known from the plan: the dataclass can't be built from this model
+            namespace[f"{prefix}_missing_field_names"] = missing_field_names
+            body.append(f"raise _cant_build_dataclass({prefix}_missing_field_names)")
+            return body, None
+        if self._fast and not self._dataclass_analyser.has_post_init():
+            # `__post_init__` may depend on `__init__` running: only skip it if unset
+            body += _dataclass_fast_construction(
+                self._dataclass_cls,
+                self._dataclass_analyser,
+                dataclass_values,
+                namespace,
+                prefix,
+            )
+            return body, f"{prefix}_obj"
+        if values and arguments == ", ".join(values) and not self._validate_types:
+            # Values are the dataclass arguments, in order: pass them unpacked
+            body = []
+            call = f"{prefix}_dataclass_cls(*{values_source})"
+        else:
+            call = f"{prefix}_dataclass_cls({arguments})"
+        # The plan can't tell every argument `__init__` requires (e.g. `InitVar`s,
+        # which are not dataclass fields): `__init__` is the last judge
+        body += [
+            "try:",
+            f"    {prefix}_obj = {call}",
+            "except TypeError as e:",
+            "    raise _cant_build_dataclass() from e",
+        ]
+        return body, f"{prefix}_obj"
+
+    def _can_translate_values_list(self) -> bool:
+        return (
+            bool(self._values_plan)
+            and not (self._recurse and self._relations_plan)
+            and all(
+                self._django_model_analyser.is_plain_column(entry[0])
+                for entry in self._values_plan
+            )
+        )
+
+    def get_select_related_paths(self) -> list[str]:
+        """
+        Returns the `select_related` lookups of the relations translated when
+        recursing, following nested relations until they loop back.
+        """
+        paths = []
+        pending = collections.deque([(self, "", (self,))])
+        while pending:
+            translator, prefix, path_translators = pending.pop()
+            if not translator._recurse:
+                continue
+            for (
+                django_field_name,
+                related_model,
+                _,
+                dataclass_field_type,
+                submapping,
+            ) in translator._relations_plan:
+                if not translator._django_model_analyser.is_single_valued_relation(
+                    django_field_name
                 ):
-                    raise exceptions.ValidationFailed(
-                        f"`{dataclass_field_value}` from `{self._django_model_instance.get_class_name()}.{dataclass_field_name}` does not match type `{dataclass_field_type}`"
+                    continue
+                path = f"{prefix}{django_field_name}"
+                paths.append(path)
+                sub_translator = translator._get_sub_translator(
+                    related_model, dataclass_field_type, submapping
+                )
+                if sub_translator not in path_translators:
+                    pending.append(
+                        (
+                            sub_translator,
+                            f"{path}__",
+                            path_translators + (sub_translator,),
+                        )
                     )
+        return paths
+
+    def translate_values_list(self, rows: typing.Iterable[tuple]) -> list:
+        """
+        Translates rows holding the plain values of the plan, in the plan order.
+        """
+        if self._translate_values is None:
+            self._translate_values = self._generate("values", "values")[0]
+        translate_values = self._translate_values
+        return [translate_values(values) for values in rows]
+
+    def translate_queryset(
+        self,
+        queryset: models.QuerySet,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+    ) -> list:
+        """
+        Translates all the instances of `queryset`, evaluating it with a single query.
+
+        When no relation is translated, rows are fetched with `values_list` and
+        translated without building model instances at all, in chunks spread over
+        `executor` workers if provided. Otherwise, translated relations are fetched
+        along with the instances through `select_related`, until they loop back to a
+        translator already visited: deeper levels of self-referencing relations are
+        fetched lazily, with a query each.
+        """
+        if not self._can_translate_values_list():
+            paths = self.get_select_related_paths()
+            if paths:
+                # `select_related()` without arguments would follow every foreign key
+                queryset = queryset.select_related(*paths)
+            return [self.translate(instance) for instance in queryset]
+
+        rows = queryset.values_list(*(entry[0] for entry in self._values_plan))
+        if executor is None:
+            return self.translate_values_list(rows)
+
+        rows = list(rows)
+        chunks = [
+            rows[start : start + _TRANSLATION_CHUNK_SIZE]
+            for start in range(0, len(rows), _TRANSLATION_CHUNK_SIZE)
+        ]
+        return list(
+            itertools.chain.from_iterable(
+                executor.map(
+                    _translate_values_list,
+                    itertools.repeat(self._signature),
+                    chunks,
+                )
+            )
+        )
+
+
+_TRANSLATION_CHUNK_SIZE = 1000
+
 
-            dataclass_kwargs[dataclass_field_name] = dataclass_field_value
+def _translate_values_list(signature: tuple, rows: list[tuple]) -> list:
+    """
+    Translates a chunk of rows in an executor worker. Only the translator signature
+    is sent to the worker, which builds the translator once per process.
+    """
+    return DjangoInstanceToDataclassTranslator.for_classes(
+        *signature
+    ).translate_values_list(rows)
 
-        if nullify_missing_fields:
-            for field_name in self._dataclass_analyser.get_field_names():
-                if field_name not in dataclass_kwargs:
-                    dataclass_kwargs[field_name] = None
 
-        try:
-            return self._dataclass_cls(**dataclass_kwargs)
-        except TypeError as e:
-            raise exceptions.CantBuildDataclass(
-                f"Some mandatory arguments are missing and dataclass can't be built. "
-                "See full stacktrace for more details or set `nullify_missing_fields` "
-                "to True to fill missing fields with None."
-            ) from e
+class DataclassToDjangoInstanceTranslator(CompiledTranslator):
+    """
+    Translates instances of a dataclass to a Django model.
 
+    Translators are built once per (dataclass, model, fields map, options) through
+    `for_classes`, and compile on first use a function specialized for them.
+    """
+
+    __slots__ = (
+        "_django_model_cls",
+        "_dataclass_analyser",
+        "_django_model_analyser",
+        "_fields_map",
+        "_recurse",
+        "_nullify_missing_fields",
+        "_mark_saved",
+        "_plan",
+    )
+
+    _cache: dict[tuple, "DataclassToDjangoInstanceTranslator"] = {}
 
-class DataclassToDjangoInstanceTranslator:
     def __init__(
         self,
-        dataclass_instance: models.Model,
+        dataclass_cls: type,
         django_model_cls: type[models.Model],
         fields_map: dict,
+        recurse: bool,
+        nullify_missing_fields: bool,
+        mark_saved: bool = False,
     ):
-        self._dataclass_instance = DataclassInstance(dataclass_instance)
+        super().__init__()
         self._django_model_cls = django_model_cls
-        self._dataclass_analyser = DataclassAnalyser(type(dataclass_instance))
-        self._django_model_analyser = DjangoModelAnalyzer(django_model_cls)
-        self._fields_map = fields_map or {}
-
-    def _get_corresponding_django_field_name(self, dataclass_field_name: str) -> str:
-        if dataclass_field_name in self._fields_map:
-            if isinstance(self._fields_map[dataclass_field_name], dict):
-                field_name = self._fields_map[dataclass_field_name].get("field_name")
-                if not field_name:
-                    raise exceptions.FieldsMapValueError(
-                        f"Can't find `field_name` key in the `fields_map` value for `{dataclass_field_name}`"
-                    )
-            else:
-                field_name = self._fields_map[dataclass_field_name]
-        else:
-            field_name = dataclass_field_name
+        self._dataclass_analyser = DataclassAnalyser.for_dataclass(dataclass_cls)
+        self._django_model_analyser = DjangoModelAnalyzer.for_model(django_model_cls)
+        self._fields_map = _normalize_fields_map(
+            fields_map, exceptions.FieldsMapValueError
+        )
+        self._recurse = recurse
+        self._nullify_missing_fields = nullify_missing_fields
+        self._mark_saved = mark_saved
+        self._plan = self._build_plan()
 
-        return field_name
+    @classmethod
+    def for_classes(
+        cls,
+        dataclass_cls: type,
+        django_model_cls: type[models.Model],
+        fields_map: dict,
+        recurse: bool,
+        nullify_missing_fields: bool,
+        mark_saved: bool = False,
+    ) -> "DataclassToDjangoInstanceTranslator":
+        """
+        Returns the translator for the given classes and options, building it only once.
+        """
+        key = (
+            dataclass_cls,
+            django_model_cls,
+            _freeze_fields_map(fields_map),
+            recurse,
+            nullify_missing_fields,
+            mark_saved,
+        )
+        if key not in cls._cache:
+            cls._cache[key] = cls(
+                dataclass_cls,
+                django_model_cls,
+                fields_map,
+                recurse,
+                nullify_missing_fields,
+                mark_saved,
+            )
+        return cls._cache[key]
 
-    def _get_corresponding_django_field_submapping(
-        self, dataclass_field_name: str
-    ) -> dict:
-        if dataclass_field_name in self._fields_map and isinstance(
-            self._fields_map[dataclass_field_name], dict
-        ):
-            return self._fields_map[dataclass_field_name].get("submapping", {})
-        return {}
+    def _build_plan(self) -> list[tuple[DataclassField, str, typing.Optional[dict]]]:
+        """
+        Resolves, once, the dataclass fields that can be mapped to the Django model.
 
-    def _get_mappable_dataclass_fields(self) -> list[DataclassField]:
+        Returns a list of `(dataclass_field, django_field_name, submapping)` tuples.
         """
-        Returns a list of dataclass fields that can be mapped to the Django model.
+        plan = []
+        for field in self._dataclass_analyser.get_fields():
+            django_field_name, submapping = self._fields_map.get(
+                field.name, (field.name, None)
+            )
+
+            if django_field_name in self._django_model_analyser:
+                plan.append((field, django_field_name, submapping))
+        return plan
+
+    def _compile(
+        self,
+    ) -> tuple[typing.Callable, dict, dict[str, CompiledTranslator]]:
         """
-        django_field_names = self._django_model_analyser.get_field_names()
-        return [
-            self._dataclass_analyser.get_field(dataclass_field_name)
-            for dataclass_field_name in self._dataclass_analyser.get_field_names()
-            if self._get_corresponding_django_field_name(dataclass_field_name)
-            in django_field_names
-        ]
+        Generates a straight-line translation function building the Django model.
 
-    def translate(self, recurse: bool, nullify_missing_fields: bool):
-        django_model_kwargs = {}
-        for field in self._get_mappable_dataclass_fields():
-            django_field_name = self._get_corresponding_django_field_name(field.name)
-            if field.is_dataclass():
-                if recurse:
-                    django_field_value = DataclassToDjangoInstanceTranslator(
-                        self._dataclass_instance.get_value(field.name),
-                        self._django_model_analyser.get_field_type(django_field_name),
-                        self._get_corresponding_django_field_submapping(field.name),
-                    ).translate(recurse, nullify_missing_fields)
-                else:
-                    django_field_value = None
+        If `mark_saved`, the model instance is marked as loaded from the database, as
+        Django does for the instances of a queryset, so that saving it updates its row.
+        """
+        namespace = {
+            "_django_model_cls": self._django_model_cls,
+            "_cant_build_dataclass": _cant_build_dataclass,
+        }
+        sub_translators = {}
+        body = []
+        django_model_kwargs = (
+            dict.fromkeys(self._django_model_analyser.get_field_names(), "None")
+            if self._nullify_missing_fields
+            else {}
+        )
+        for index, (field, django_field_name, submapping) in enumerate(self._plan):
+            if not field.is_dataclass():
+                django_model_kwargs[django_field_name] = f"instance.{field.name}"
+            elif self._recurse:
+                sub_translators[
+                    f"_translate_{index}"
+                ] = DataclassToDjangoInstanceTranslator.for_classes(
+                    field.type,
+                    self._django_model_analyser.get_field_type(django_field_name),
+                    submapping,
+                    self._recurse,
+                    self._nullify_missing_fields,
+                    self._mark_saved,
+                )
+                body += [
+                    f"_related_{index} = instance.{field.name}",
+                    f"if _related_{index} is not None:",
+                    f"    _related_{index} = _translate_{index}(_related_{index})",
+                ]
+                django_model_kwargs[django_field_name] = f"_related_{index}"
             else:
-                django_field_value = self._dataclass_instance.get_value(field.name)
-            django_model_kwargs[django_field_name] = django_field_value
-
-        if nullify_missing_fields:
-            for field_name in self._django_model_analyser.get_field_names():
-                if field_name not in django_model_kwargs:
-                    django_model_kwargs[field_name] = None
-
-        try:
-            return self._django_model_cls(**django_model_kwargs)
-        except TypeError as e:
-            raise exceptions.CantBuildDataclass(
-                f"Some mandatory arguments are missing and dataclass can't be built. "
-                "See full stacktrace for more details or set `nullify_missing_fields` "
-                "to True to fill missing fields with None."
-            ) from e
+                django_model_kwargs[django_field_name] = "None"
+
+        arguments = ", ".join(
+            f"{name}={value}" for name, value in django_model_kwargs.items()
+        )
+        body += [
+            "try:",
+            f"    _instance = _django_model_cls({arguments})",
+            "except TypeError as e:",
+            "    raise _cant_build_dataclass() from e",
+        ]
+        if self._mark_saved:
+            namespace["_db_for_write"] = router.db_for_write
+            body += [
+                "_instance._state.adding = False",
+                "_instance._state.db = _db_for_write(_django_model_cls, instance=_instance)",
+            ]
+        body.append("return _instance")
+        return (
+            _create_function("translate", "instance", body, namespace),
+            namespace,
+            sub_translators,
+        )
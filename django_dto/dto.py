@@ -1,9 +1,15 @@
+import concurrent.futures
+import dataclasses
+import sys
+
 from django.db import models
 
 from django_dto import core
 
 
 class DTOMixin:
+    __slots__ = ()
+
     def to_dto(
         self,
         dataclass_cls: type,
@@ -11,6 +17,7 @@ class DTOMixin:
         validate_types: bool = False,
         recurse: bool = False,
         nullify_missing_fields: bool = False,
+        fast: bool = False,
     ) -> type:
         """
         Converts a Django model instance to a dataclass instance.
@@ -20,7 +27,8 @@ class DTOMixin:
             fields_map (Optional): A dictionary that remaps the value of each model field to a dataclass field.
             validate_types (Optional): If True, validates that the Django model values are of the same type as the dataclass types.
             recurse (Optional): If True, recursively accesses foreign keys.
-            nullify_missing_fields (Optional): If True, fills missing fields in the dataclass with None.
+            nullify_missing_fields (Optional): If True, fills missing mandatory fields in the dataclass with None.
+            fast (Optional): If True, builds the dataclass instance without calling its `__init__`.
 
         Returns:
             dataclass: The converted dataclass instance.
@@ -29,11 +37,98 @@ class DTOMixin:
             - If a model field is defined in the `fields_map`, it will be used to build a dataclass equivalent.
             - If `recurse` is True, foreign keys will be recursively accessed and converted to dataclass instances.
             - If `nullify_missing_fields` is True, mandatory fields in the dataclass that are not present in the model will be filled with None.
+            - If `fast` is True, fields are set directly on the dataclass instance, falling back to defaults for fields
+              that are not mapped. Dataclasses defining `__post_init__` are always built through `__init__`.
+        """
+
+        return core.DjangoInstanceToDataclassTranslator.for_classes(
+            type(self),
+            dataclass_cls,
+            fields_map,
+            validate_types,
+            recurse,
+            nullify_missing_fields,
+            fast,
+        ).translate(self)
+
+    @classmethod
+    def to_dto_many(
+        cls,
+        queryset: models.QuerySet,
+        dataclass_cls: type,
+        fields_map: dict = None,
+        validate_types: bool = False,
+        recurse: bool = False,
+        nullify_missing_fields: bool = False,
+        executor: concurrent.futures.Executor = None,
+        fast: bool = False,
+    ) -> list:
         """
+        Converts all the instances of a queryset to dataclass instances.
 
-        return core.DjangoInstanceToDataclassTranslator(
-            self, dataclass_cls, fields_map
-        ).translate(validate_types, recurse, nullify_missing_fields)
+        Args:
+            queryset: The queryset of model instances to convert, whose model is the one converted.
+            dataclass_cls: The dataclass class to convert the model instances to.
+            fields_map (Optional): A dictionary that remaps the value of each model field to a dataclass field.
+            validate_types (Optional): If True, validates that the Django model values are of the same type as the dataclass types.
+            recurse (Optional): If True, recursively accesses foreign keys.
+            nullify_missing_fields (Optional): If True, fills missing mandatory fields in the dataclass with None.
+            executor (Optional): An executor used to convert chunks of the queryset rows concurrently.
+            fast (Optional): If True, builds the dataclass instances without calling their `__init__`.
+
+        Returns:
+            list: The converted dataclass instances.
+
+        Note:
+            - The conversion is prepared once for the whole queryset, which is evaluated with a single query.
+            - If `recurse` is False, only the mapped columns are fetched and no model instance is built.
+            - If `recurse` is True, foreign keys are fetched along with the instances through `select_related`,
+              until they loop back to a dataclass already visited: deeper levels of self-referencing foreign keys
+              are fetched with one query per instance and level, as with `to_dto`.
+            - `executor` is only used when `recurse` is False. With a `ProcessPoolExecutor`, the model and the
+              dataclass must be importable, and Django set up, in the worker processes.
+        """
+
+        return core.DjangoInstanceToDataclassTranslator.for_classes(
+            queryset.model,
+            dataclass_cls,
+            fields_map,
+            validate_types,
+            recurse,
+            nullify_missing_fields,
+            fast,
+        ).translate_queryset(queryset, executor)
+
+    @classmethod
+    def prefetch_for_dto(
+        cls,
+        queryset: models.QuerySet,
+        dataclass_cls: type,
+        fields_map: dict = None,
+    ) -> models.QuerySet:
+        """
+        Prepares a queryset to be converted to dataclass instances with `recurse=True`.
+
+        Args:
+            queryset: The queryset of model instances to prepare, whose model is the one converted.
+            dataclass_cls: The dataclass class the model instances will be converted to.
+            fields_map (Optional): A dictionary that remaps the value of each model field to a dataclass field.
+
+        Returns:
+            QuerySet: The queryset fetching, along with the instances, the foreign keys mapped to the dataclass.
+
+        Note:
+            - Foreign keys are followed recursively through the nested dataclasses, until they loop back to a
+              dataclass already visited (e.g. self-referencing foreign keys are fetched one level deep).
+        """
+
+        paths = core.DjangoInstanceToDataclassTranslator.for_classes(
+            queryset.model, dataclass_cls, fields_map, False, True, False
+        ).get_select_related_paths()
+        if not paths:
+            # `select_related()` without arguments would follow every foreign key
+            return queryset
+        return queryset.select_related(*paths)
 
 
 class DTOModel(models.Model, DTOMixin):
@@ -42,12 +137,15 @@ class DTOModel(models.Model, DTOMixin):
 
 
 class DjangoModelMixin:
+    __slots__ = ()
+
     def to_model(
         self,
         django_model_cls: type[models.Model],
         fields_map: dict = None,
         recurse: bool = False,
         nullify_missing_fields: bool = False,
+        mark_saved: bool = False,
     ) -> models.Model:
         """
         Converts a dataclass instance to a Django model instance.
@@ -56,10 +154,42 @@ class DjangoModelMixin:
             django_model_cls: The Django model class to convert to.
             fields_map: A dictionary that maps dataclass field names to model field names. Defaults to None.
             recurse: If True, recursively access foreign keys. Defaults to False.
+            mark_saved: If True, marks the model instance as loaded from the database, so that saving it updates
+                its row. Use it when the dataclass holds a row already saved, primary key included. Defaults to False.
 
         Returns:
             django.db.models.Model: The converted Django model instance.
         """
-        return core.DataclassToDjangoInstanceTranslator(
-            self, django_model_cls, fields_map
-        ).translate(recurse, nullify_missing_fields)
+        return core.DataclassToDjangoInstanceTranslator.for_classes(
+            type(self),
+            django_model_cls,
+            fields_map,
+            recurse,
+            nullify_missing_fields,
+            mark_saved,
+        ).translate(self)
+
+
+def dataclass(cls: type = None, /, **kwargs):
+    """
+    Same as `dataclasses.dataclass`, but generates slotted dataclasses by default.
+
+    Args:
+        cls: The class to turn into a dataclass, when used as `@dataclass` without arguments.
+        kwargs (Optional): The arguments of `dataclasses.dataclass`.
+
+    Returns:
+        The dataclass, or a decorator building it if `cls` is not provided.
+
+    Note:
+        - Slotted dataclasses are smaller and faster to build, but their instances don't accept attributes
+          other than their fields. Pass `slots=False` to opt out.
+        - `slots` is only available from Python 3.10: on older versions it is ignored and plain dataclasses
+          are generated.
+    """
+    if sys.version_info >= (3, 10):
+        kwargs.setdefault("slots", True)
+    else:
+        # `dataclasses.dataclass` doesn't accept `slots` before Python 3.10
+        kwargs.pop("slots", None)
+    return dataclasses.dataclass(cls, **kwargs)
@@ -24,3 +24,7 @@ class NotADataclass(DjangoDTOException):
 
 class FieldsMapKeyError(DjangoDTOException):
     pass
+
+
+class FieldsMapValueError(DjangoDTOException):
+    pass
@@ -31,3 +31,8 @@ class TestModelNotSupportingDjangoDTO(models.Model, django_dto.DTOMixin):
     foreign_key = models.ForeignKey(
         TestModelForeignKeyNotSupportingDjangoDTO, on_delete=models.CASCADE, null=True
     )
+
+
+class TestModelSelfReferencing(models.Model, django_dto.DTOMixin):
+    char_field = models.CharField(max_length=128)
+    parent = models.ForeignKey("self", on_delete=models.CASCADE, null=True)
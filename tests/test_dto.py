@@ -1,11 +1,15 @@
+import concurrent.futures
 import dataclasses
 import datetime
+import sys
+import typing
 from time import timezone
 
 import pytest
+from django.db.models import QuerySet
 from django.utils import timezone
 
-from django_dto import dto, exceptions
+from django_dto import core, dto, exceptions
 from tests import models
 
 
@@ -283,6 +287,25 @@ def test_to_dto_should_raise_cant_build_dataclass_if_mandatory_dataclass_fields_
         m.to_dto(TestDataclass, validate_types=True, nullify_missing_fields=False)
 
 
+@pytest.mark.django_db
+def test_to_dto_should_raise_cant_build_dataclass_if_a_required_init_var_is_missing(
+    faker,
+):
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: str
+        token: dataclasses.InitVar[str]
+
+        def __post_init__(self, token):
+            pass
+
+    m = models.TestModel.objects.create(
+        char_field=faker.first_name(), integer_field=faker.pyint()
+    )
+    with pytest.raises(exceptions.CantBuildDataclass):
+        m.to_dto(TestDataclass)
+
+
 @pytest.mark.django_db
 def test_to_dto_succeeds_if_mandatory_data_class_fields_are_not_in_the_model_but_nullify_missing_dataclass_fields_true(
     faker,
@@ -463,3 +486,585 @@ def test_to_model_should_succeed_when_fields_can_be_mapped_with_field_renaming_a
         translated_django_model.foreign_key.char_field
         == test_dataclass._foreign_key._char_field
     )
+
+
+def test_to_model_should_raise_fields_map_value_error_if_field_name_is_missing(
+    faker,
+):
+    @dataclasses.dataclass
+    class TestDataclass(dto.DjangoModelMixin):
+        _char_field: str
+
+    test_dataclass = TestDataclass(_char_field=faker.first_name())
+
+    with pytest.raises(exceptions.FieldsMapValueError):
+        test_dataclass.to_model(
+            models.TestModel,
+            fields_map={"_char_field": {"submapping": {}}},
+        )
+
+
+@pytest.mark.django_db
+def test_dto_validation_resolves_string_annotations(faker):
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: "str"
+        integer_field: "int"
+        date_time: "datetime.datetime"
+
+    date_time = timezone.now()
+    char_field = faker.first_name()
+    integer_field = faker.pyint()
+
+    m = models.TestModel.objects.create(
+        char_field=char_field, integer_field=integer_field, date_time=date_time
+    )
+    assert m.to_dto(TestDataclass, validate_types=True) == TestDataclass(
+        char_field=char_field, integer_field=integer_field, date_time=date_time
+    )
+
+
+@pytest.mark.django_db
+def test_dto_validation_resolves_string_annotations_next_to_unresolvable_ones(
+    faker,
+):
+    @dataclasses.dataclass
+    class ForeignKeyDataclass:
+        char_field: str
+
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: "str"
+        integer_field: "int"
+        # Not reachable from the module (NameError) and not evaluable (TypeError)
+        foreign_key: "ForeignKeyDataclass"
+        unsupported: "int | 'str'" = None
+
+    char_field = faker.first_name()
+    integer_field = faker.pyint()
+
+    m = models.TestModel.objects.create(
+        char_field=char_field, integer_field=integer_field
+    )
+    assert m.to_dto(TestDataclass, validate_types=True) == TestDataclass(
+        char_field=char_field, integer_field=integer_field, foreign_key=None
+    )
+
+
+@pytest.mark.django_db
+def test_to_dto_should_translate_null_foreign_key_to_none_when_recursing(faker):
+    @dataclasses.dataclass
+    class ForeignKeyDataclass:
+        char_field: str
+
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: str
+        foreign_key: ForeignKeyDataclass
+
+    char_field = faker.first_name()
+
+    m = models.TestModel.objects.create(
+        char_field=char_field, integer_field=faker.pyint()
+    )
+    assert m.to_dto(TestDataclass, recurse=True) == TestDataclass(
+        char_field=char_field, foreign_key=None
+    )
+
+
+@pytest.mark.django_db
+def test_to_dto_should_keep_dataclass_defaults_for_fields_not_in_the_model(faker):
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: str
+        missing_field: str = "default"
+        integer_field: int = 0
+
+    char_field = faker.first_name()
+    integer_field = faker.pyint()
+
+    m = models.TestModel.objects.create(
+        char_field=char_field, integer_field=integer_field
+    )
+    assert m.to_dto(TestDataclass) == TestDataclass(
+        char_field=char_field, missing_field="default", integer_field=integer_field
+    )
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires Python 3.10+")
+@pytest.mark.django_db
+def test_to_dto_should_pass_keyword_only_fields_declared_among_positional_ones(
+    faker,
+):
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: str
+        integer_field: int = dataclasses.field(kw_only=True)
+        date_time: datetime.datetime
+
+    char_field = faker.first_name()
+    integer_field = faker.pyint()
+    date_time = timezone.now()
+
+    m = models.TestModel.objects.create(
+        char_field=char_field, integer_field=integer_field, date_time=date_time
+    )
+    assert m.to_dto(TestDataclass) == TestDataclass(
+        char_field, date_time, integer_field=integer_field
+    )
+
+
+@pytest.mark.django_db
+def test_to_dto_nullify_missing_fields_should_keep_dataclass_defaults(faker):
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: str
+        missing_field: str
+        missing_field_with_default: str = "default"
+
+    char_field = faker.first_name()
+
+    m = models.TestModel.objects.create(
+        char_field=char_field, integer_field=faker.pyint()
+    )
+    assert m.to_dto(TestDataclass, nullify_missing_fields=True) == TestDataclass(
+        char_field=char_field, missing_field=None
+    )
+
+
+@pytest.mark.django_db
+def test_to_dto_should_not_map_model_fields_to_dataclass_fields_excluded_from_init(
+    faker,
+):
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: str
+        integer_field: int = dataclasses.field(default=0, init=False)
+
+    char_field = faker.first_name()
+
+    m = models.TestModel.objects.create(
+        char_field=char_field, integer_field=faker.pyint(min_value=1)
+    )
+    expected = TestDataclass(char_field=char_field)
+    assert m.to_dto(TestDataclass) == expected
+    assert m.to_dto(TestDataclass, fast=True) == expected
+    assert m.to_dto(TestDataclass, fast=True).integer_field == 0
+
+
+@dataclasses.dataclass
+class SelfReferencingDataclass:
+    char_field: str
+    parent: "SelfReferencingDataclass"
+
+
+@pytest.mark.django_db
+def test_to_dto_should_convert_self_referencing_foreign_keys_recursively(faker):
+    root_char_field = faker.first_name()
+    child_char_field = faker.first_name()
+
+    root = models.TestModelSelfReferencing.objects.create(char_field=root_char_field)
+    child = models.TestModelSelfReferencing.objects.create(
+        char_field=child_char_field, parent=root
+    )
+
+    assert child.to_dto(SelfReferencingDataclass, recurse=True) == (
+        SelfReferencingDataclass(
+            char_field=child_char_field,
+            parent=SelfReferencingDataclass(char_field=root_char_field, parent=None),
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_to_dto_many_should_convert_queryset_to_dataclasses(
+    faker, django_assert_num_queries
+):
+    @dataclasses.dataclass
+    class TestDataclass:
+        _char_field: str
+        integer_field: int
+        foreign_key: typing.Optional[str] = None
+
+    instances = [
+        models.TestModel.objects.create(
+            char_field=faker.first_name(), integer_field=faker.pyint()
+        )
+        for _ in range(3)
+    ]
+
+    with django_assert_num_queries(1):
+        dtos = models.TestModel.to_dto_many(
+            models.TestModel.objects.order_by("pk"),
+            TestDataclass,
+            fields_map={"char_field": "_char_field"},
+            validate_types=True,
+        )
+
+    assert dtos == [
+        TestDataclass(
+            _char_field=instance.char_field, integer_field=instance.integer_field
+        )
+        for instance in instances
+    ]
+
+
+@pytest.mark.django_db
+def test_to_dto_many_should_convert_the_queryset_model(faker):
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: str
+        integer_field: int = 0
+
+    m = models.TestModel.objects.create(
+        char_field=faker.first_name(), integer_field=faker.pyint(min_value=1)
+    )
+
+    assert models.TestModelForeignKey.to_dto_many(
+        models.TestModel.objects.all(), TestDataclass
+    ) == [TestDataclass(char_field=m.char_field, integer_field=m.integer_field)]
+
+
+@pytest.mark.django_db
+def test_to_dto_many_should_fetch_foreign_keys_in_the_same_query_if_recurse_is_true(
+    faker, django_assert_num_queries
+):
+    @dataclasses.dataclass
+    class ForeignKeyDataclass:
+        char_field: str
+
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: str
+        foreign_key: ForeignKeyDataclass
+
+    instances = [
+        models.TestModel.objects.create(
+            char_field=faker.first_name(),
+            integer_field=faker.pyint(),
+            foreign_key=models.TestModelForeignKey.objects.create(
+                char_field=faker.pystr()
+            ),
+        )
+        for _ in range(3)
+    ]
+
+    with django_assert_num_queries(1):
+        dtos = models.TestModel.to_dto_many(
+            models.TestModel.objects.order_by("pk"), TestDataclass, recurse=True
+        )
+
+    assert dtos == [
+        TestDataclass(
+            char_field=instance.char_field,
+            foreign_key=ForeignKeyDataclass(char_field=instance.foreign_key.char_field),
+        )
+        for instance in instances
+    ]
+
+
+@pytest.mark.django_db
+def test_to_dto_many_should_select_self_referencing_foreign_keys_one_level_deep(
+    faker, django_assert_num_queries
+):
+    root = models.TestModelSelfReferencing.objects.create(char_field=faker.first_name())
+    parent = models.TestModelSelfReferencing.objects.create(
+        char_field=faker.first_name(), parent=root
+    )
+    child = models.TestModelSelfReferencing.objects.create(
+        char_field=faker.first_name(), parent=parent
+    )
+
+    # The child's parent comes with the child, its grandparent takes a query
+    with django_assert_num_queries(2):
+        dtos = models.TestModelSelfReferencing.to_dto_many(
+            models.TestModelSelfReferencing.objects.filter(pk=child.pk),
+            SelfReferencingDataclass,
+            recurse=True,
+        )
+
+    assert dtos == [child.to_dto(SelfReferencingDataclass, recurse=True)]
+
+
+@pytest.mark.django_db
+def test_to_dto_many_should_not_select_related_if_no_foreign_key_is_translated(
+    faker, mocker
+):
+    @dataclasses.dataclass
+    class TestDataclass:
+        foreign_key: typing.Any
+
+    models.TestModel.objects.create(
+        char_field=faker.first_name(),
+        integer_field=faker.pyint(),
+        foreign_key=models.TestModelForeignKey.objects.create(char_field=faker.pystr()),
+    )
+    select_related = mocker.spy(
+        models.TestModel.objects.none().__class__, "select_related"
+    )
+
+    assert models.TestModel.to_dto_many(
+        models.TestModel.objects.all(), TestDataclass
+    ) == [TestDataclass(foreign_key=None)]
+    select_related.assert_not_called()
+
+
+def test_translator_signature_should_not_follow_later_fields_map_changes():
+    @dataclasses.dataclass
+    class TestDataclass:
+        renamed_char_field: str
+
+    fields_map = {"char_field": "renamed_char_field"}
+    translator = core.DjangoInstanceToDataclassTranslator.for_classes(
+        models.TestModel, TestDataclass, fields_map, False, False, False
+    )
+    fields_map["char_field"] = "other_char_field"
+
+    # Executor workers rebuild the translator from its signature
+    assert (
+        core.DjangoInstanceToDataclassTranslator.for_classes(*translator._signature)
+        is translator
+    )
+
+
+@pytest.mark.django_db
+def test_to_dto_many_should_convert_queryset_chunks_with_executor(faker, monkeypatch):
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: str
+        integer_field: int
+
+    monkeypatch.setattr(core, "_TRANSLATION_CHUNK_SIZE", 2)
+    instances = [
+        models.TestModel.objects.create(
+            char_field=faker.first_name(), integer_field=faker.pyint()
+        )
+        for _ in range(5)
+    ]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        dtos = models.TestModel.to_dto_many(
+            models.TestModel.objects.order_by("pk"), TestDataclass, executor=executor
+        )
+
+    assert dtos == [
+        TestDataclass(
+            char_field=instance.char_field, integer_field=instance.integer_field
+        )
+        for instance in instances
+    ]
+
+
+def test_dataclass_analyser_field_availability():
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: str
+
+    analyser = core.DataclassAnalyser.for_dataclass(TestDataclass)
+
+    assert analyser.is_field_available("char_field")
+    assert not analyser.is_field_available("missing_field")
+    assert "char_field" in analyser
+    assert "missing_field" not in analyser
+
+
+@pytest.mark.django_db
+def test_to_dto_fast_should_fill_dataclass_without_init(faker, mocker):
+    @dataclasses.dataclass(frozen=True)
+    class TestDataclass:
+        char_field: str
+        integer_field: int
+        missing_field: str = "default"
+        missing_list: list = dataclasses.field(default_factory=list)
+
+    char_field = faker.first_name()
+    integer_field = faker.pyint()
+
+    m = models.TestModel.objects.create(
+        char_field=char_field, integer_field=integer_field
+    )
+    expected = TestDataclass(char_field=char_field, integer_field=integer_field)
+    init = mocker.spy(TestDataclass, "__init__")
+
+    assert m.to_dto(TestDataclass, fast=True) == expected
+    assert init.call_count == 0
+
+
+@pytest.mark.django_db
+def test_prefetch_for_dto_should_select_foreign_keys_mapped_to_dataclass(
+    faker, django_assert_num_queries
+):
+    @dataclasses.dataclass
+    class ForeignKeyDataclass:
+        char_field: str
+
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: str
+        foreign_key: ForeignKeyDataclass
+
+    for _ in range(3):
+        models.TestModel.objects.create(
+            char_field=faker.first_name(),
+            integer_field=faker.pyint(),
+            foreign_key=models.TestModelForeignKey.objects.create(
+                char_field=faker.pystr()
+            ),
+        )
+
+    queryset = models.TestModel.prefetch_for_dto(
+        models.TestModel.objects.all(), TestDataclass
+    )
+    with django_assert_num_queries(1):
+        dtos = [m.to_dto(TestDataclass, recurse=True) for m in queryset]
+
+    assert len(dtos) == 3
+    assert all(isinstance(dto.foreign_key, ForeignKeyDataclass) for dto in dtos)
+
+
+@pytest.mark.django_db
+def test_to_dto_fast_should_fill_foreign_key_dataclasses_without_init(faker, mocker):
+    @dataclasses.dataclass
+    class ForeignKeyDataclass:
+        char_field: str
+
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: str
+        foreign_key: ForeignKeyDataclass
+
+    char_field = faker.first_name()
+    foreign_key__char_field = faker.pystr()
+
+    m = models.TestModel.objects.create(
+        char_field=char_field,
+        integer_field=faker.pyint(),
+        foreign_key=models.TestModelForeignKey.objects.create(
+            char_field=foreign_key__char_field
+        ),
+    )
+    expected = TestDataclass(
+        char_field=char_field,
+        foreign_key=ForeignKeyDataclass(char_field=foreign_key__char_field),
+    )
+    init = mocker.spy(ForeignKeyDataclass, "__init__")
+
+    assert m.to_dto(TestDataclass, recurse=True, fast=True) == expected
+    assert init.call_count == 0
+
+
+@pytest.mark.django_db
+def test_dto_validation_should_accept_any_and_none_for_optional_fields(faker):
+    @dataclasses.dataclass
+    class TestDataclass:
+        char_field: typing.Any
+        integer_field: typing.Optional[int]
+        date_time: typing.Optional[datetime.datetime]
+
+    char_field = faker.first_name()
+    integer_field = faker.pyint()
+
+    m = models.TestModel.objects.create(
+        char_field=char_field, integer_field=integer_field, date_time=None
+    )
+    assert m.to_dto(TestDataclass, validate_types=True) == TestDataclass(
+        char_field=char_field, integer_field=integer_field, date_time=None
+    )
+
+    m.integer_field = faker.pystr()
+    with pytest.raises(exceptions.ValidationFailed):
+        m.to_dto(TestDataclass, validate_types=True)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires Python 3.10+")
+@pytest.mark.django_db
+def test_dataclass_should_generate_slotted_dataclasses(faker):
+    @dto.dataclass
+    class TestDataclass(dto.DjangoModelMixin):
+        char_field: str
+        integer_field: int
+
+    char_field = faker.first_name()
+    integer_field = faker.pyint()
+
+    m = models.TestModel.objects.create(
+        char_field=char_field, integer_field=integer_field
+    )
+    dataclass_instance = m.to_dto(TestDataclass)
+
+    assert not hasattr(dataclass_instance, "__dict__")
+    assert dataclass_instance == TestDataclass(
+        char_field=char_field, integer_field=integer_field
+    )
+    assert m.to_dto(TestDataclass, fast=True) == dataclass_instance
+    assert dataclass_instance.to_model(models.TestModel).char_field == char_field
+
+
+@pytest.mark.django_db
+def test_to_model_mark_saved_should_mark_model_instance_as_loaded_from_database(
+    faker,
+):
+    @dataclasses.dataclass
+    class TestDataclass(dto.DjangoModelMixin):
+        id: int
+        char_field: str
+        integer_field: int
+
+    m = models.TestModel.objects.create(
+        char_field=faker.first_name(), integer_field=faker.pyint()
+    )
+    char_field = faker.first_name()
+
+    model_instance = TestDataclass(
+        id=m.id, char_field=char_field, integer_field=m.integer_field
+    ).to_model(models.TestModel, mark_saved=True)
+
+    assert model_instance._state.adding is False
+    assert model_instance._state.db == "default"
+
+    model_instance.save()
+    assert models.TestModel.objects.get().char_field == char_field
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires Python 3.10+")
+@pytest.mark.django_db
+def test_to_dto_fast_should_fill_dataclasses_mixing_slotted_and_plain_classes(
+    faker,
+):
+    class PlainBase:
+        pass
+
+    @dto.dataclass
+    class SlottedDataclass(PlainBase):
+        char_field: str
+        integer_field: int
+
+    @dataclasses.dataclass(slots=True)
+    class SlottedBase:
+        char_field: str
+
+    @dataclasses.dataclass
+    class PlainDataclass(SlottedBase):
+        integer_field: int
+
+    char_field = faker.first_name()
+    integer_field = faker.pyint()
+
+    m = models.TestModel.objects.create(
+        char_field=char_field, integer_field=integer_field
+    )
+    for dataclass_cls in (SlottedDataclass, PlainDataclass):
+        assert m.to_dto(dataclass_cls, fast=True) == dataclass_cls(
+            char_field=char_field, integer_field=integer_field
+        )
+
+
+def test_dataclass_should_ignore_slots_before_python_3_10(monkeypatch):
+    monkeypatch.setattr(sys, "version_info", (3, 9, 18))
+
+    @dto.dataclass(slots=True)
+    class TestDataclass:
+        char_field: str
+
+    assert "__slots__" not in vars(TestDataclass)
+    assert TestDataclass(char_field="char_field").char_field == "char_field"